@@ -2,8 +2,10 @@
 """
 Example usage of the LlamaAPI client.
 """
+import asyncio
 import os
 import logging
+import httpx
 from llamaapi import (
     create_client, 
     ApiKeyAuth, 
@@ -22,37 +24,37 @@ def simple_client_example():
     api_key = os.environ.get("API_KEY", "demo-api-key")
     
     # Create API client
-    client = create_client(
+    with create_client(
         base_url="https://api.example.com/v1",
         auth=ApiKeyAuth(api_key),
         timeout=10,
         retries=3,
-    )
-    
-    # Make GET request
-    response = client.get("users")
-    response.raise_for_status()
-    users = response.json()
-    print(f"Found {len(users)} users")
-    
-    # Make POST request
-    new_user = {"name": "John Doe", "email": "john.doe@example.com"}
-    response = client.post("users", json=new_user)
-    response.raise_for_status()
-    created_user = response.json()
-    print(f"Created user: {created_user['name']} (ID: {created_user['id']})")
-    
-    # Make PUT request to update user
-    updated_data = {"name": "John Smith"}
-    response = client.put(f"users/{created_user['id']}", json=updated_data)
-    response.raise_for_status()
-    updated_user = response.json()
-    print(f"Updated user: {updated_user['name']}")
-    
-    # Make DELETE request
-    response = client.delete(f"users/{created_user['id']}")
-    response.raise_for_status()
-    print(f"Deleted user with ID: {created_user['id']}")
+    ) as client:
+    
+        # Make GET request
+        response = client.get("users")
+        response.raise_for_status()
+        users = response.json()
+        print(f"Found {len(users)} users")
+    
+        # Make POST request
+        new_user = {"name": "John Doe", "email": "john.doe@example.com"}
+        response = client.post("users", json=new_user)
+        response.raise_for_status()
+        created_user = response.json()
+        print(f"Created user: {created_user['name']} (ID: {created_user['id']})")
+    
+        # Make PUT request to update user
+        updated_data = {"name": "John Smith"}
+        response = client.put(f"users/{created_user['id']}", json=updated_data)
+        response.raise_for_status()
+        updated_user = response.json()
+        print(f"Updated user: {updated_user['name']}")
+    
+        # Make DELETE request
+        response = client.delete(f"users/{created_user['id']}")
+        response.raise_for_status()
+        print(f"Deleted user with ID: {created_user['id']}")
 
 def advanced_client_example():
     """Advanced API client example with middleware and caching."""
@@ -66,62 +68,81 @@ def advanced_client_example():
     ]
     
     # Create API client with middleware and caching
-    client = create_client(
+    with create_client(
         base_url="https://api.example.com/v1",
         auth=BearerAuth(token),
         timeout=15,
         middleware=middleware,
         cache=MemoryCache(max_size=100),
-    )
-    
-    # Make GET request (will be cached)
-    print("Making first request (not cached)...")
-    response = client.get("products", params={"category": "electronics"})
-    response.raise_for_status()
-    products = response.json()
-    print(f"Found {len(products)} products")
-    
-    # Make same request again (should use cache)
-    print("Making second request (should use cache)...")
-    response = client.get("products", params={"category": "electronics"})
-    response.raise_for_status()
-    products = response.json()
-    print(f"Found {len(products)} products from cache")
+    ) as client:
+    
+        # Make GET request (will be cached)
+        print("Making first request (not cached)...")
+        response = client.get("products", params={"category": "electronics"})
+        response.raise_for_status()
+        products = response.json()
+        print(f"Found {len(products)} products")
+    
+        # Make same request again (should use cache)
+        print("Making second request (should use cache)...")
+        response = client.get("products", params={"category": "electronics"})
+        response.raise_for_status()
+        products = response.json()
+        print(f"Found {len(products)} products from cache")
     
     # Streaming response example
     print("Streaming large dataset...")
-    with client.stream("GET", "large-dataset") as response:
-        for chunk in response.iter_lines():
-            if chunk:
-                print(f"Received chunk: {len(chunk)} bytes")
+    asyncio.run(stream_large_dataset("https://api.example.com/v1", token))
+
+async def stream_large_dataset(base_url, token, chunk_size=64 * 1024):
+    """Stream a large dataset in fixed-size chunks and split it into lines."""
+    headers = {"Authorization": f"Bearer {token}"}
+    
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, timeout=15) as client:
+        async with client.stream("GET", "large-dataset") as response:
+            # Carry partial lines over between chunks in a single buffer
+            buffer = bytearray()
+            async for chunk in response.aiter_bytes(chunk_size):
+                buffer += chunk
+                start = 0
+                end = buffer.find(b"\n")
+                while end != -1:
+                    if end > start:
+                        print(f"Received chunk: {end - start} bytes")
+                    start = end + 1
+                    end = buffer.find(b"\n", start)
+                del buffer[:start]
+            
+            if buffer:
+                print(f"Received chunk: {len(buffer)} bytes")
 
 def error_handling_example():
     """Example demonstrating error handling."""
-    client = create_client(
+    with create_client(
         base_url="https://api.example.com/v1",
         auth=ApiKeyAuth("invalid-key"),
-    )
+    ) as client:
     
-    try:
-        # This should result in an authentication error
-        response = client.get("protected-resource")
-        response.raise_for_status()
-    except Exception as e:
-        print(f"Caught error: {type(e).__name__} - {str(e)}")
+        try:
+            # This should result in an authentication error
+            response = client.get("protected-resource")
+            response.raise_for_status()
+        except Exception as e:
+            print(f"Caught error: {type(e).__name__} - {str(e)}")
     
-    try:
-        # This should result in a resource not found error
-        response = client.get("nonexistent-resource")
-        response.raise_for_status()
-    except Exception as e:
-        print(f"Caught error: {type(e).__name__} - {str(e)}")
+        try:
+            # This should result in a resource not found error
+            response = client.get("nonexistent-resource")
+            response.raise_for_status()
+        except Exception as e:
+            print(f"Caught error: {type(e).__name__} - {str(e)}")
     
-    try:
-        # This should result in a validation error
-        response = client.post("users", json={"invalid": "data"})
-        response.raise_for_status()
-    except Exception as e:
-        print(f"Caught error: {type(e).__name__} - {str(e)}")
+        try:
+            # This should result in a validation error
+            response = client.post("users", json={"invalid": "data"})
+            response.raise_for_status()
+        except Exception as e:
+            print(f"Caught error: {type(e).__name__} - {str(e)}")
 
 if __name__ == "__main__":
     print("=== Simple Client Example ===")
@@ -3,10 +3,13 @@
 Example usage of the LlamaAPI server utilities.
 """
 import asyncio
+import itertools
 import logging
+from typing import Any, Dict, Optional, Set
+import orjson
 import uvicorn
-from fastapi import FastAPI, Request as FastAPIRequest
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI
+from starlette.routing import Mount
 
 from llamaapi import (
     create_api,
@@ -19,8 +22,9 @@ from llamaapi import (
     add_cors_headers
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Configure logging; per-request INFO logging is too costly on the hot path,
+# lower the level to INFO to see each request logged while developing
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 # Create API instance
@@ -32,7 +36,32 @@ users = {
     "2": {"id": "2", "name": "Jane Smith", "email": "jane.smith@example.com"},
 }
 
-next_user_id = 3
+# Source of new user IDs; count.__next__ is atomic, unlike a global counter
+_next_user_id = itertools.count(3).__next__
+
+# Lowercased user name -> IDs of users with that name, maintained on writes
+_name_index: Dict[str, Set[str]] = {}
+
+# JSON-encoded list of all users, re-encoded lazily after a write
+_users_encoded: Optional[bytes] = None
+
+def _index_user(user: Dict[str, Any]) -> None:
+    _name_index.setdefault(user["name"].lower(), set()).add(user["id"])
+
+def _unindex_user(user: Dict[str, Any]) -> None:
+    name = user["name"].lower()
+    user_ids = _name_index.get(name)
+    if user_ids is not None:
+        user_ids.discard(user["id"])
+        if not user_ids:
+            del _name_index[name]
+
+def _invalidate_users() -> None:
+    global _users_encoded
+    _users_encoded = None
+
+for _user in users.values():
+    _index_user(_user)
 
 # Add global middleware
 api.add_middleware(log_request)
@@ -59,6 +88,8 @@ async def auth_middleware(request: Request) -> Request:
 api.add_middleware(auth_middleware)
 
 # Route handlers
+# Not wrapped in cache_response: the unfiltered list is already kept
+# encoded in _users_encoded, and a second cache layer would shadow it
 @api.route("/users", methods=HttpMethod.GET)
 async def get_users(request: Request) -> Response:
     """Get all users or filter by query parameters."""
@@ -66,25 +97,35 @@ async def get_users(request: Request) -> Response:
     name_filter = request.query_params.get("name")
     
     if name_filter:
-        filtered_users = {
-            user_id: user for user_id, user in users.items() 
-            if name_filter.lower() in user["name"].lower()
+        name_filter = name_filter.lower()
+        matching_ids = {
+            user_id
+            for name, user_ids in _name_index.items()
+            if name_filter in name
+            for user_id in user_ids
         }
-        return Response().with_json(list(filtered_users.values()))
+        # IDs come from a counter, so numeric order is insertion order
+        filtered_users = [users[user_id] for user_id in sorted(matching_ids, key=int)]
+        return Response().with_json(filtered_users)
     
-    return Response().with_json(list(users.values()))
+    global _users_encoded
+    if _users_encoded is None:
+        _users_encoded = orjson.dumps(list(users.values()))
+    return Response().with_raw_json(_users_encoded)
 
 @api.route("/users/{user_id}", methods=HttpMethod.GET)
+@api.cache_response
 async def get_user(request: Request) -> Response:
     """Get a single user by ID."""
     user_id = request.path_params.get("user_id")
     
-    if user_id not in users:
+    user = users.get(user_id)
+    if user is None:
         return Response(status_code=404).with_json(
             {"error": f"User with ID {user_id} not found", "code": "not_found"}
         )
     
-    return Response().with_json(users[user_id])
+    return Response().with_json(user)
 
 @api.route(
     "/users", 
@@ -93,11 +134,8 @@ async def get_user(request: Request) -> Response:
 )
 async def create_user(request: Request) -> Response:
     """Create a new user."""
-    global next_user_id
-    
     user_data = request.json()
-    user_id = str(next_user_id)
-    next_user_id += 1
+    user_id = str(_next_user_id())
     
     new_user = {
         "id": user_id,
@@ -105,6 +143,9 @@ async def create_user(request: Request) -> Response:
     }
     
     users[user_id] = new_user
+    _index_user(new_user)
+    _invalidate_users()
+    api.invalidate_cache("/users")
     
     return Response(status_code=201).with_json(new_user)
 
@@ -117,20 +158,22 @@ async def update_user(request: Request) -> Response:
     """Update an existing user."""
     user_id = request.path_params.get("user_id")
     
-    if user_id not in users:
+    user = users.get(user_id)
+    if user is None:
         return Response(status_code=404).with_json(
             {"error": f"User with ID {user_id} not found", "code": "not_found"}
         )
     
     user_data = request.json()
     
-    # Update the user
-    users[user_id] = {
-        "id": user_id,
-        **user_data
-    }
+    # Update the user in place
+    _unindex_user(user)
+    user.update(user_data)
+    _index_user(user)
+    _invalidate_users()
+    api.invalidate_cache("/users")
     
-    return Response().with_json(users[user_id])
+    return Response().with_json(user)
 
 @api.route("/users/{user_id}", methods=HttpMethod.DELETE)
 @require_auth
@@ -138,11 +181,6 @@ async def delete_user(request: Request) -> Response:
     """Delete a user (requires authentication)."""
     user_id = request.path_params.get("user_id")
     
-    if user_id not in users:
-        return Response(status_code=404).with_json(
-            {"error": f"User with ID {user_id} not found", "code": "not_found"}
-        )
-    
     # Check for admin role
     if request.context.get("user", {}).get("role") != "admin":
         return Response(status_code=403).with_json(
@@ -150,44 +188,40 @@ async def delete_user(request: Request) -> Response:
         )
     
     # Delete the user
-    deleted_user = users.pop(user_id)
+    deleted_user = users.pop(user_id, None)
+    if deleted_user is None:
+        return Response(status_code=404).with_json(
+            {"error": f"User with ID {user_id} not found", "code": "not_found"}
+        )
+    
+    _unindex_user(deleted_user)
+    _invalidate_users()
+    api.invalidate_cache("/users")
     
     return Response().with_json({"message": f"User {deleted_user['name']} deleted"})
 
-# FastAPI integration
-fastapi_app = FastAPI(title="LlamaAPI Server Example")
-
-@fastapi_app.api_route("/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "HEAD", "PATCH"])
-async def proxy_to_llamaapi(request: FastAPIRequest, path: str):
-    """
-    Proxy requests to our LlamaAPI instance.
-    """
-    # Build llamaapi Request from FastAPI request
-    body = await request.body()
-    if body:
-        try:
-            body = await request.json()
-        except:
-            pass
-    
-    llamaapi_request = Request(
-        method=request.method,
-        path=f"/{path}",
-        headers=dict(request.headers),
-        query_params=dict(request.query_params),
-        body=body
-    )
-    
-    # Process the request with our API
-    response = await api.handle_request(llamaapi_request)
-    
-    # Convert to FastAPI response
-    return JSONResponse(
-        content=response.body,
-        status_code=response.status_code,
-        headers=response.headers
-    )
+# FastAPI integration: the API is an ASGI application in its own right, so
+# mount it as the only route. FastAPI's own OpenAPI/docs routes are disabled
+# so that they are not matched ahead of the mount on every request.
+fastapi_app = FastAPI(
+    title="LlamaAPI Server Example",
+    openapi_url=None,
+    routes=[Mount("/", app=api)],
+)
 
 if __name__ == "__main__":
-    # Run the FastAPI app with uvicorn
-    uvicorn.run(fastapi_app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    # Run the FastAPI app with uvicorn (uvloop when installed) + httptools,
+    # without access logging or proxy/server/date header handling. The user
+    # store is in-process memory, so this must stay a single worker.
+    uvicorn.run(
+        fastapi_app,
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="httptools",
+        access_log=False,
+        proxy_headers=False,
+        server_header=False,
+        date_header=False,
+        log_level="warning",
+    )
@@ -33,12 +33,16 @@ setup(
     packages=find_packages(where="src"),
     python_requires=">=3.8",
     install_requires=[
-        "requests>=2.25.0",
         "pydantic>=1.9.0",
         "PyYAML>=6.0",
         "redis>=4.3.4",
         "ujson>=5.4.0",
-        "httpx>=0.23.0",
+        "orjson>=3.9.0",
+        "fastjsonschema>=2.18.0",
+        "blake3>=0.4.0",
+        "cachetools>=5.2.0",
+        "zstandard>=0.21.0",
+        "httpx[http2]>=0.23.0",
         "marshmallow>=3.17.0",
         "openapi-spec-validator>=0.4.0",
     ],
@@ -55,11 +59,14 @@ setup(
             "flask>=2.2.0",
             "fastapi>=0.85.0",
             "uvicorn>=0.18.3",
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+            "httptools>=0.5.0",
         ],
         "auth": [
             "pyjwt>=2.4.0",
             "cryptography>=37.0.4",
         ],
+        # cachetools is now a core dependency; kept so existing pins still resolve
         "cache": [
             "cachetools>=5.2.0",
         ],
@@ -38,6 +38,7 @@ from llamaapi.server import (
     require_auth,
     log_request, 
     validate_json_schema, 
+    JsonSchemaValidator,
     add_cors_headers
 )
 
@@ -84,6 +85,7 @@ __all__ = [
     "require_auth", 
     "log_request", 
     "validate_json_schema", 
+    "JsonSchemaValidator",
     "add_cors_headers",
     
     # OpenAPI
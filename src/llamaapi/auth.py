@@ -4,7 +4,7 @@ Authentication implementations for API clients.
 from typing import Dict, Optional, Any, List
 import base64
 import time
-import requests
+import httpx
 from abc import ABC, abstractmethod
 import urllib.parse
 from datetime import datetime, timedelta
@@ -192,8 +192,6 @@ class OAuth2Auth(BaseAuth):
         Returns:
             The token response as a dictionary.
         """
-        import requests  # Import here to avoid circular imports
-        
         data = {
             "grant_type": grant_type,
             "client_id": self.client_id,
@@ -205,10 +203,10 @@ class OAuth2Auth(BaseAuth):
             data["scope"] = self.scope
         
         try:
-            response = requests.post(self.token_url, data=data)
+            response = httpx.post(self.token_url, data=data)
             response.raise_for_status()
             return response.json()
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             raise AuthenticationError(f"Failed to fetch OAuth token: {str(e)}")
     
     def refresh_access_token(self):
@@ -10,6 +10,8 @@ import time
 from typing import Any, Dict, Optional, Union
 import logging
 
+from cachetools import LRUCache
+
 logger = logging.getLogger(__name__)
 
 class BaseCache(ABC):
@@ -82,7 +84,7 @@ class NoCache(BaseCache):
 
 class MemoryCache(BaseCache):
     """
-    In-memory cache implementation.
+    In-memory cache implementation with least-recently-used eviction.
     """
     def __init__(self, max_size: int = 1000):
         """
@@ -91,9 +93,11 @@ class MemoryCache(BaseCache):
         Args:
             max_size: Maximum number of items to store in the cache.
         """
-        self.cache: Dict[str, Dict[str, Any]] = {}
+        # Maps key -> (value, expires_at); LRUCache handles eviction
+        self.cache: LRUCache = LRUCache(maxsize=max_size)
         self.max_size = max_size
-        self.lock = threading.RLock()
+        # LRUCache reorders entries on reads too, so every access is locked
+        self.lock = threading.Lock()
     
     def get(self, key: str) -> Optional[Any]:
         """
@@ -106,18 +110,18 @@ class MemoryCache(BaseCache):
             The cached value or None if not found or expired.
         """
         with self.lock:
-            if key not in self.cache:
+            item = self.cache.get(key)
+            if item is None:
                 return None
             
-            item = self.cache[key]
-            expires_at = item.get("expires_at")
+            value, expires_at = item
             
             # Check if the item has expired
-            if expires_at and time.time() > expires_at:
+            if expires_at is not None and time.time() > expires_at:
                 del self.cache[key]
                 return None
             
-            return item["value"]
+            return value
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """
@@ -128,20 +132,11 @@ class MemoryCache(BaseCache):
             value: The value to cache.
             ttl: Time-to-live in seconds.
         """
+        # Calculate expiration time if TTL is provided
+        expires_at = time.time() + ttl if ttl else None
+        
         with self.lock:
-            # Evict oldest items if cache is full
-            if len(self.cache) >= self.max_size and key not in self.cache:
-                self._evict_oldest()
-            
-            # Calculate expiration time if TTL is provided
-            expires_at = time.time() + ttl if ttl else None
-            
-            # Store the value with expiration time
-            self.cache[key] = {
-                "value": value,
-                "expires_at": expires_at,
-                "created_at": time.time()
-            }
+            self.cache[key] = (value, expires_at)
     
     def delete(self, key: str) -> None:
         """
@@ -151,8 +146,7 @@ class MemoryCache(BaseCache):
             key: The cache key.
         """
         with self.lock:
-            if key in self.cache:
-                del self.cache[key]
+            self.cache.pop(key, None)
     
     def clear(self) -> None:
         """
@@ -160,17 +154,6 @@ class MemoryCache(BaseCache):
         """
         with self.lock:
             self.cache.clear()
-    
-    def _evict_oldest(self) -> None:
-        """
-        Evict the oldest item from the cache.
-        """
-        if not self.cache:
-            return
-        
-        # Find the oldest item based on creation time
-        oldest_key = min(self.cache.keys(), key=lambda k: self.cache[k]["created_at"])
-        del self.cache[oldest_key]
 
 
 class FileCache(BaseCache):
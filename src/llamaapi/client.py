@@ -2,15 +2,13 @@
 API Client implementation for making HTTP requests.
 """
 from typing import Any, Dict, List, Optional, Union, BinaryIO, Tuple, Callable
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import httpx
+import blake3
 import logging
+from concurrent.futures import Future
 from contextlib import contextmanager
-import hashlib
-import json
+import threading
 import time
-import urllib.parse
 
 from llamaapi.auth import BaseAuth, ApiKeyAuth
 from llamaapi.middleware import Middleware
@@ -19,6 +17,11 @@ from llamaapi.exceptions import ApiError, AuthenticationError, RateLimitError, S
 
 logger = logging.getLogger(__name__)
 
+# Responses worth retrying, and the idempotent methods that may be retried
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRY_METHODS = frozenset({'GET', 'PUT', 'DELETE', 'HEAD', 'OPTIONS'})
+RETRY_BACKOFF_FACTOR = 0.3
+
 class ApiRequest:
     """
     Represents an API request with all its attributes.
@@ -47,9 +50,9 @@ class ApiRequest:
 
 class ApiResponse:
     """
-    Wrapper around requests.Response with additional functionality.
+    Wrapper around httpx.Response with additional functionality.
     """
-    def __init__(self, response: requests.Response):
+    def __init__(self, response: httpx.Response):
         self._response = response
         
     @property
@@ -58,9 +61,9 @@ class ApiResponse:
         return self._response.status_code
         
     @property
-    def headers(self) -> Dict[str, str]:
-        """Get the response headers."""
-        return dict(self._response.headers)
+    def headers(self) -> httpx.Headers:
+        """Get the response headers (case-insensitive)."""
+        return self._response.headers
         
     @property
     def content(self) -> bytes:
@@ -78,17 +81,17 @@ class ApiResponse:
         
     def iter_content(self, chunk_size: int = 1024):
         """Iterate over the response content in chunks."""
-        return self._response.iter_content(chunk_size=chunk_size)
+        return self._response.iter_bytes(chunk_size=chunk_size)
         
     def iter_lines(self, chunk_size: int = 1024):
         """Iterate over the response content line by line."""
-        return self._response.iter_lines(chunk_size=chunk_size)
+        return self._response.iter_lines()
         
     def raise_for_status(self):
         """Raise an exception for HTTP error responses."""
         try:
             self._response.raise_for_status()
-        except requests.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             status_code = self.status_code
             
             # Try to get more detailed error message from JSON response
@@ -139,6 +142,7 @@ class ApiClient:
         cache_ttl: int = 300,
         verify_ssl: bool = True,
         user_agent: Optional[str] = None,
+        transport: Optional[httpx.BaseTransport] = None,
     ):
         """
         Initialize the API client.
@@ -153,37 +157,56 @@ class ApiClient:
             cache_ttl: Time-to-live for cached responses in seconds.
             verify_ssl: Whether to verify SSL certificates.
             user_agent: Custom User-Agent header value.
+            transport: Optional httpx transport to send requests through
+                instead of the default pooled HTTP/2 transport.
         """
         self.base_url = base_url.rstrip('/')
         self.auth = auth
         self.timeout = timeout
+        self.retries = retries
         self.middleware = middleware or []
         self.cache = cache or NoCache()
         self.cache_ttl = cache_ttl
         self.verify_ssl = verify_ssl
         
-        # Set up the requests session
-        self.session = requests.Session()
-        self.session.verify = verify_ssl
+        # Futures for cacheable requests currently in flight, by cache key
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
         
         # Configure default headers
         default_headers = {
             'User-Agent': user_agent or f'LlamaAPI-Client/1.0',
             'Accept': 'application/json',
         }
-        self.session.headers.update(default_headers)
-        
-        # Configure retry behavior
-        if retries > 0:
-            retry_strategy = Retry(
-                total=retries,
-                backoff_factor=0.3,
-                status_forcelist=[429, 500, 502, 503, 504],
-                allowed_methods=["GET", "PUT", "DELETE", "HEAD", "OPTIONS"]
-            )
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-            self.session.mount("http://", adapter)
-            self.session.mount("https://", adapter)
+        
+        # Set up a pooled transport so that consecutive requests reuse the
+        # same TCP/TLS connection (multiplexed over HTTP/2 where supported).
+        # Connection failures are retried by the transport itself; retryable
+        # status codes are handled in _send.
+        self._transport = transport or httpx.HTTPTransport(
+            verify=verify_ssl,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            retries=retries,
+        )
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            headers=default_headers,
+            timeout=timeout,
+            transport=self._transport,
+        )
+    
+    def close(self) -> None:
+        """Close the underlying connection pool."""
+        self._client.close()
+    
+    def __enter__(self):
+        """Support for context manager protocol."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close the connection pool when exiting context."""
+        self.close()
     
     def _build_url(self, endpoint: str) -> str:
         """
@@ -253,16 +276,23 @@ class ApiClient:
         if request.method not in ['GET', 'HEAD', 'OPTIONS']:
             return None
             
-        # Build a key from the request attributes
-        key_parts = [
-            request.method,
-            request.url,
-            urllib.parse.urlencode(sorted(request.params.items())),
-            json.dumps(request.headers, sort_keys=True),
-        ]
-        
-        key = '::'.join(str(part) for part in key_parts)
-        return hashlib.md5(key.encode('utf-8')).hexdigest()
+        # Hash the request attributes directly, NUL-separated
+        h = blake3.blake3()
+        h.update(request.method.encode())
+        h.update(b"\x00")
+        h.update(request.url.encode())
+        for name in sorted(request.params):
+            h.update(b"\x00")
+            h.update(str(name).encode())
+            h.update(b"=")
+            h.update(str(request.params[name]).encode())
+        for name in sorted(request.headers):
+            h.update(b"\x00")
+            h.update(name.encode())
+            h.update(b":")
+            h.update(str(request.headers[name]).encode())
+        
+        return h.hexdigest(16)
     
     def request(
         self,
@@ -328,22 +358,83 @@ class ApiClient:
                 logger.debug(f"Cache hit for {method} {url}")
                 return cached_response
         
-        # Make the request
+        # Streamed bodies can only be read once, so they are never shared
+        if not cache_key or request.stream:
+            return self._send(request, cache_key)
+        
+        # Coalesce concurrent identical requests: the first caller sends the
+        # request and any others wait for its result
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[cache_key] = future
+        
+        if not is_leader:
+            logger.debug(f"Waiting on in-flight {method} request to {url}")
+            return future.result()
+        
+        try:
+            api_response = self._send(request, cache_key)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(api_response)
+            return api_response
+        finally:
+            with self._inflight_lock:
+                del self._inflight[cache_key]
+    
+    def _send(self, request: ApiRequest, cache_key: Optional[str] = None) -> ApiResponse:
+        """
+        Send a prepared request and process the response.
+        
+        Args:
+            request: The prepared request.
+            cache_key: The cache key to store a successful response under.
+            
+        Returns:
+            The API response.
+        """
+        method, url = request.method, request.url
+        
         try:
             logger.debug(f"Making {method} request to {url}")
             start_time = time.time()
             
-            response = self.session.request(
+            # Raw bodies go through ``content``; httpx reserves ``data`` for forms
+            data, content = request.data, None
+            if isinstance(data, (bytes, str)):
+                data, content = None, data
+            
+            http_request = self._client.build_request(
                 method=request.method,
                 url=request.url,
                 headers=request.headers,
                 params=request.params,
-                data=request.data,
+                data=data,
+                content=content,
                 json=request.json,
                 files=request.files,
                 timeout=request.timeout,
-                stream=request.stream,
             )
+            response = self._client.send(http_request, stream=request.stream)
+            
+            # Retry idempotent requests on throttling and transient server errors
+            if method in RETRY_METHODS:
+                for attempt in range(self.retries):
+                    if response.status_code not in RETRY_STATUS_CODES:
+                        break
+                    delay = self._get_retry_delay(response, attempt)
+                    logger.debug(
+                        f"Retrying {method} request to {url} after {delay:.2f}s "
+                        f"({attempt + 1}/{self.retries}, status {response.status_code})"
+                    )
+                    response.close()
+                    time.sleep(delay)
+                    response = self._client.send(http_request, stream=request.stream)
             
             elapsed = time.time() - start_time
             logger.debug(f"Request completed in {elapsed:.2f}s with status {response.status_code}")
@@ -355,18 +446,36 @@ class ApiClient:
             api_response = self._process_response(api_response)
             
             # Cache the response if cacheable
-            if cache_key and not stream and 200 <= api_response.status_code < 300:
+            if cache_key and not request.stream and 200 <= api_response.status_code < 300:
                 self.cache.set(cache_key, api_response, ttl=self.cache_ttl)
             
             return api_response
             
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             raise ApiError(f"Request timed out after {request.timeout} seconds")
-        except requests.exceptions.ConnectionError:
+        except httpx.TransportError:
             raise ApiError(f"Connection error while connecting to {url}")
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             raise ApiError(f"Request error: {str(e)}")
     
+    @staticmethod
+    def _get_retry_delay(response: httpx.Response, attempt: int) -> float:
+        """
+        Work out how long to wait before retrying a request.
+        
+        Args:
+            response: The response that triggered the retry.
+            attempt: The retry attempt (0-based).
+            
+        Returns:
+            The delay in seconds, taken from Retry-After when it is given in
+            seconds, otherwise an exponential backoff.
+        """
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return float(retry_after)
+        return RETRY_BACKOFF_FACTOR * (2 ** attempt)
+    
     def get(self, endpoint: str, **kwargs) -> ApiResponse:
         """Make a GET request."""
         return self.request("GET", endpoint, **kwargs)
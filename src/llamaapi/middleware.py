@@ -6,7 +6,7 @@ import time
 import gzip
 import json
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 import random
 import threading
 
@@ -113,7 +113,7 @@ class LoggingMiddleware(Middleware):
         if self.log_headers and response.headers:
             self.logger.log(self.log_level, f"Response Headers: {dict(response.headers)}")
         
-        if self.log_body and not response._response._content_consumed:
+        if self.log_body and response._response.is_stream_consumed:
             try:
                 if 'application/json' in response.headers.get('Content-Type', ''):
                     body = json.dumps(response.json())
@@ -355,7 +355,7 @@ class CompressionMiddleware(Middleware):
         return request
     
     def after_response(self, response):
-        """Handle decompression of response if needed (usually done by requests)."""
+        """Handle decompression of response if needed (usually done by httpx)."""
         return response
 
 
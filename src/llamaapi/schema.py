@@ -1,6 +1,8 @@
 """
 Schema validation utilities for API requests and responses.
 """
+from __future__ import annotations
+
 from typing import Dict, Any, Optional, List, Type, Union, Callable, get_type_hints
 from enum import Enum
 import re
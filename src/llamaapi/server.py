@@ -1,21 +1,46 @@
 """
 Server utilities for building API endpoints.
 """
+import gzip
 import inspect
-import json
 import logging
+import re
 import time
 import traceback
 from dataclasses import dataclass, field
 from enum import Enum
-from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Set, Type, Union, get_type_hints
+from functools import lru_cache, wraps
+from hashlib import blake2b
+from typing import (
+    Any, Callable, Dict, Iterator, List, Mapping, Optional, Set, Tuple, Type, Union, get_type_hints
+)
+from urllib.parse import parse_qsl
+
+import fastjsonschema
+import orjson
+import zstandard
+from cachetools import LRUCache
 
 from llamaapi.exceptions import ValidationError, ResourceNotFoundError, ServerError
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Maximum number of encoded responses kept by cache_response()
+_RESPONSE_CACHE_SIZE = 1024
+
+# Responses smaller than this are sent uncompressed
+_COMPRESS_MIN_SIZE = 1024
+
+# Shared zstd compressor so its context is only set up once
+_zstd_compressor = zstandard.ZstdCompressor(level=1)
+
+# Supported content encodings, in order of preference
+_COMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {
+    "zstd": _zstd_compressor.compress,
+    "gzip": lambda body: gzip.compress(body, compresslevel=1),
+}
+
 class HttpMethod(str, Enum):
     """HTTP methods supported by the API."""
     GET = "GET"
@@ -27,6 +52,106 @@ class HttpMethod(str, Enum):
     HEAD = "HEAD"
 
 
+# Encoded (lowercased) header names, keyed by the name as written in code
+_HEADER_KEYS: Dict[str, bytes] = {}
+
+# Pre-encoded header pairs for the values nearly every response carries
+_ENCODED_HEADER_VALUES: Dict[Tuple[bytes, str], Tuple[bytes, bytes]] = {
+    (b"content-type", "application/json"): (b"content-type", b"application/json"),
+}
+
+
+def _header_key(name: str) -> bytes:
+    """
+    Get the encoded, lowercased form of a header name.
+    
+    Args:
+        name: The header name.
+        
+    Returns:
+        The header name as ASGI expects it.
+    """
+    key = _HEADER_KEYS.get(name)
+    if key is None:
+        key = _HEADER_KEYS[name] = name.lower().encode("latin-1")
+    return key
+
+
+def _encode_headers(headers: Mapping[str, str]) -> List[Tuple[bytes, bytes]]:
+    """
+    Encode response headers for ASGI, leaving out Content-Length.
+    
+    Args:
+        headers: The response headers.
+        
+    Returns:
+        A list of (name, value) byte pairs.
+    """
+    encoded = []
+    for name, value in headers.items():
+        key = _header_key(name)
+        if key == b"content-length":
+            continue
+        pair = _ENCODED_HEADER_VALUES.get((key, value))
+        if pair is None:
+            pair = (key, str(value).encode("latin-1"))
+        encoded.append(pair)
+    return encoded
+
+
+class _RawHeaders(Mapping):
+    """
+    Read-only, case-insensitive view over raw ASGI request headers.
+    
+    Headers are kept as the (name, value) byte pairs from the ASGI scope and
+    only decoded when looked up.
+    """
+    __slots__ = ("_raw",)
+    
+    def __init__(self, raw: List[Tuple[bytes, bytes]]):
+        self._raw = raw
+    
+    def __getitem__(self, name: str) -> str:
+        key = _header_key(name)
+        for raw_name, raw_value in self._raw:
+            if raw_name == key:
+                return raw_value.decode("latin-1")
+        raise KeyError(name)
+    
+    def __iter__(self) -> Iterator[str]:
+        return (raw_name.decode("latin-1") for raw_name, _ in self._raw)
+    
+    def __len__(self) -> int:
+        return len(self._raw)
+
+
+class _RawQueryParams(Mapping):
+    """
+    Read-only view over a raw query string, parsed on first access.
+    """
+    __slots__ = ("_query_string", "_params")
+    
+    def __init__(self, query_string: bytes):
+        self._query_string = query_string
+        self._params: Optional[Dict[str, str]] = None
+    
+    def _parse(self) -> Dict[str, str]:
+        if self._params is None:
+            self._params = dict(
+                parse_qsl(self._query_string.decode("latin-1"), keep_blank_values=True)
+            )
+        return self._params
+    
+    def __getitem__(self, name: str) -> str:
+        return self._parse()[name]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._parse())
+    
+    def __len__(self) -> int:
+        return len(self._parse())
+
+
 @dataclass
 class Request:
     """
@@ -34,17 +159,22 @@ class Request:
     """
     method: str
     path: str
-    headers: Dict[str, str]
-    query_params: Dict[str, str] = field(default_factory=dict)
+    headers: Mapping[str, str]
+    query_params: Mapping[str, str] = field(default_factory=dict)
     body: Optional[Any] = None
     path_params: Dict[str, str] = field(default_factory=dict)
     files: Dict[str, Any] = field(default_factory=dict)
     context: Dict[str, Any] = field(default_factory=dict)
+    # (body, parsed JSON) from the last call to json()
+    _parsed_json: Optional[Tuple[Any, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     def json(self) -> Any:
         """
         Parse the request body as JSON.
         
+        The result is memoized, so middleware and the handler can both call
+        this without parsing the body twice.
+        
         Returns:
             The parsed JSON data.
             
@@ -57,13 +187,15 @@ class Request:
         if isinstance(self.body, (dict, list)):
             return self.body
             
-        try:
-            if isinstance(self.body, bytes):
-                return json.loads(self.body.decode('utf-8'))
-            elif isinstance(self.body, str):
-                return json.loads(self.body)
-        except json.JSONDecodeError as e:
-            raise ValidationError(f"Invalid JSON: {str(e)}")
+        if isinstance(self.body, (bytes, str)):
+            if self._parsed_json is not None and self._parsed_json[0] is self.body:
+                return self._parsed_json[1]
+            try:
+                data = orjson.loads(self.body)
+            except orjson.JSONDecodeError as e:
+                raise ValidationError(f"Invalid JSON: {str(e)}")
+            self._parsed_json = (self.body, data)
+            return data
             
         return self.body
     
@@ -114,14 +246,31 @@ class Response:
     status_code: int = 200
     body: Optional[Any] = None
     headers: Dict[str, str] = field(default_factory=dict)
+    compress: bool = True
     
     def with_json(self, data: Any) -> 'Response':
         """
         Set the response body as JSON data.
         
+        The data is serialized immediately, so the body holds the encoded bytes.
+        
         Args:
             data: The data to serialize as JSON.
             
+        Returns:
+            The updated response.
+        """
+        self.body = orjson.dumps(data)
+        self.headers['Content-Type'] = 'application/json'
+        return self
+    
+    def with_raw_json(self, data: bytes) -> 'Response':
+        """
+        Set the response body to already-encoded JSON.
+        
+        Args:
+            data: The encoded JSON bytes.
+            
         Returns:
             The updated response.
         """
@@ -157,6 +306,58 @@ class Response:
         return self
 
 
+def _is_async_callable(obj: Any) -> bool:
+    """
+    Check whether calling an object returns a coroutine.
+    
+    Args:
+        obj: A function or callable object.
+        
+    Returns:
+        True if the object is a coroutine function or has an async __call__.
+    """
+    return inspect.iscoroutinefunction(obj) or inspect.iscoroutinefunction(
+        getattr(obj, "__call__", None)
+    )
+
+
+def _compile_chain(middleware: List[Callable], handler: Optional[Callable] = None) -> Callable:
+    """
+    Fold a list of middleware, and optionally a handler, into one coroutine.
+    
+    The generated function calls each middleware in turn with straight-line
+    code, so dispatch does not iterate over the middleware list. Middleware
+    that is not known to be async is awaited only if it returns an awaitable.
+    
+    Args:
+        middleware: The middleware functions, in order.
+        handler: Optional async handler to call with the final request.
+        
+    Returns:
+        An async function taking a request and returning the handler's
+        response, or the processed request if there is no handler.
+    """
+    namespace: Dict[str, Any] = {"_isawaitable": inspect.isawaitable}
+    lines = ["async def chain(request):"]
+    for i, mw in enumerate(middleware):
+        name = f"_mw{i}"
+        namespace[name] = mw
+        if _is_async_callable(mw):
+            lines.append(f"    request = await {name}(request)")
+        else:
+            lines.append(f"    request = {name}(request)")
+            lines.append("    if _isawaitable(request):")
+            lines.append("        request = await request")
+    if handler is not None:
+        namespace["_handler"] = handler
+        lines.append("    return await _handler(request)")
+    else:
+        lines.append("    return request")
+    
+    exec("\n".join(lines), namespace)
+    return namespace["chain"]
+
+
 class Route:
     """
     Represents a route handler for an API endpoint.
@@ -188,6 +389,11 @@ class Route:
         self.required_params = required_params or []
         self.required_body_fields = required_body_fields or []
         
+        # Middleware and handler folded into a single coroutine, rebuilt by
+        # handle() if the middleware list has changed since
+        self.compiled_handler = _compile_chain(self.middleware, handler)
+        self._compiled_middleware = list(self.middleware)
+        
         # Extract path parameter names from the path pattern
         self.path_params = []
         parts = path.split('/')
@@ -262,8 +468,9 @@ class Route:
         Returns:
             The response.
         """
-        # Extract path parameters
-        request.path_params = self.extract_path_params(request.path)
+        # Extract path parameters, unless the dispatcher already has
+        if not request.path_params:
+            request.path_params = self.extract_path_params(request.path)
         
         # Validate required parameters
         if self.required_params:
@@ -273,12 +480,11 @@ class Route:
         if self.required_body_fields and request.method in ['POST', 'PUT', 'PATCH']:
             request.validate_required_body_fields(self.required_body_fields)
         
-        # Apply middleware
-        for middleware in self.middleware:
-            request = await middleware(request)
-            
-        # Call the handler
-        return await self.handler(request)
+        # Apply middleware and call the handler
+        if self._compiled_middleware != self.middleware:
+            self.compiled_handler = _compile_chain(self.middleware, self.handler)
+            self._compiled_middleware = list(self.middleware)
+        return await self.compiled_handler(request)
 
 
 class API:
@@ -297,8 +503,21 @@ class API:
         self.version = version
         self.routes: List[Route] = []
         self.middleware: List[Callable] = []
+        self._middleware_chain = _compile_chain(self.middleware)
+        self._compiled_middleware: List[Callable] = []
         self.error_handlers: Dict[Type[Exception], Callable] = {}
         
+        # Per-method combined route regex, built by finalize()
+        self._dispatch: Optional[Dict[str, Tuple[re.Pattern, List[Tuple[Route, List[Tuple[str, str]]]]]]] = None
+        self._dispatch_size = 0
+        
+        # Encoded GET responses keyed by (path, query), see cache_response()
+        self._response_cache: LRUCache = LRUCache(maxsize=_RESPONSE_CACHE_SIZE)
+        
+        # Bumped by invalidate_cache() so that responses computed across an
+        # invalidation are not stored
+        self._cache_generation = 0
+        
         # Register default error handlers
         self.register_error_handler(ValidationError, self._handle_validation_error)
         self.register_error_handler(ResourceNotFoundError, self._handle_not_found)
@@ -312,6 +531,8 @@ class API:
             middleware: The middleware function.
         """
         self.middleware.append(middleware)
+        self._middleware_chain = _compile_chain(self.middleware)
+        self._compiled_middleware = list(self.middleware)
     
     def register_error_handler(
         self, 
@@ -392,6 +613,122 @@ class API:
         
         # Add the route
         self.routes.append(route)
+        self._dispatch = None
+    
+    def finalize(self) -> None:
+        """
+        Compile the registered routes into one regex per HTTP method.
+        
+        Each route becomes a named alternative, in registration order, so a
+        request is dispatched with a single match instead of testing every
+        route. Called automatically on the first request after routes change.
+        """
+        grouped: Dict[str, List[Route]] = {}
+        for route in self.routes:
+            grouped.setdefault(route.method, []).append(route)
+        
+        dispatch = {}
+        for method, routes in grouped.items():
+            alternatives = []
+            entries = []
+            for i, route in enumerate(routes):
+                parts = []
+                groups = []
+                for part in route.path.split('/'):
+                    if part.startswith('{') and part.endswith('}'):
+                        group = f"r{i}_{len(groups)}"
+                        groups.append((part[1:-1], group))
+                        parts.append(f"(?P<{group}>[^/]+)")
+                    else:
+                        parts.append(re.escape(part))
+                alternatives.append(f"(?P<r{i}>{'/'.join(parts)})")
+                entries.append((route, groups))
+            dispatch[method] = (re.compile("|".join(alternatives)), entries)
+        
+        self._dispatch = dispatch
+        self._dispatch_size = len(self.routes)
+    
+    def cache_response(self, handler: Callable) -> Callable:
+        """
+        Decorator to cache the encoded responses of a GET route handler.
+        
+        Successful responses are stored per path and query string, tagged
+        with an ETag, and served from the cache until invalidate_cache() is
+        called for their path or they are evicted as least recently used.
+        Requests whose If-None-Match header matches the ETag receive an
+        empty 304 response. Compressed variants are cached alongside the
+        original body, each with its own ETag.
+        
+        Args:
+            handler: The route handler function.
+            
+        Returns:
+            Wrapped handler function.
+        """
+        async_handler = self._ensure_async(handler)
+        
+        @wraps(handler)
+        async def wrapper(request: Request) -> Response:
+            key = (request.path, tuple(sorted(request.query_params.items())))
+            cached = self._response_cache.get(key)
+            if cached is None:
+                generation = self._cache_generation
+                response = await async_handler(request)
+                if response.status_code != 200:
+                    return response
+                
+                body = _encode_body(response.body)
+                etag = f'"{blake2b(body, digest_size=8).hexdigest()}"'
+                headers = dict(response.headers)
+                compressible = (
+                    response.compress
+                    and len(body) >= _COMPRESS_MIN_SIZE
+                    and not _has_header(headers, "content-encoding")
+                )
+                if compressible:
+                    headers["Vary"] = "Accept-Encoding"
+                cached = (headers, {None: (body, etag)}, compressible)
+                
+                # Don't store a body that may predate a concurrent write
+                if generation == self._cache_generation:
+                    self._response_cache[key] = cached
+            
+            # Pick the encoded variant, compressing it on first use
+            headers, variants, compressible = cached
+            encoding = None
+            if compressible:
+                encoding = _negotiate_encoding(request.headers.get("accept-encoding", ""))
+            variant = variants.get(encoding)
+            if variant is None:
+                body, etag = variants[None]
+                variant = (_COMPRESSORS[encoding](body), f'{etag[:-1]}-{encoding}"')
+                variants[encoding] = variant
+            
+            body, etag = variant
+            if _etag_matches(request.headers.get("if-none-match"), etag):
+                not_modified = {"ETag": etag}
+                if compressible:
+                    not_modified["Vary"] = "Accept-Encoding"
+                return Response(status_code=304, headers=not_modified, compress=False)
+            headers = {**headers, "ETag": etag}
+            if encoding:
+                headers["Content-Encoding"] = encoding
+            return Response(body=body, headers=headers, compress=False)
+        
+        return wrapper
+    
+    def invalidate_cache(self, path: str = "/") -> None:
+        """
+        Drop cached responses for a path and everything below it.
+        
+        Args:
+            path: The path prefix to invalidate; defaults to all paths.
+        """
+        self._cache_generation += 1
+        prefix = path.rstrip("/") + "/"
+        for key in list(self._response_cache):
+            if key[0] == path or key[0].startswith(prefix):
+                del self._response_cache[key]
     
     def _ensure_async(self, func: Callable) -> Callable:
         """
@@ -422,30 +759,118 @@ class API:
         Returns:
             The response.
         """
-        # Apply global middleware
-        for middleware in self.middleware:
+        # Apply global middleware, recompiling if the list was changed directly
+        if self._compiled_middleware != self.middleware:
+            self._middleware_chain = _compile_chain(self.middleware)
+            self._compiled_middleware = list(self.middleware)
+        try:
+            request = await self._middleware_chain(request)
+        except Exception as e:
+            return await self._handle_exception(e)
+        
+        # Find a matching route
+        if self._dispatch is None or self._dispatch_size != len(self.routes):
+            self.finalize()
+        
+        dispatch = self._dispatch.get(request.method)
+        match = dispatch[0].fullmatch(request.path) if dispatch else None
+        if match:
+            route, groups = dispatch[1][int(match.lastgroup[1:])]
+            request.path_params = {name: match.group(group) for name, group in groups}
             try:
-                middleware_result = middleware(request)
-                if inspect.isawaitable(middleware_result):
-                    request = await middleware_result
-                else:
-                    request = middleware_result
+                return await route.handle(request)
             except Exception as e:
                 return await self._handle_exception(e)
         
-        # Find a matching route
-        for route in self.routes:
-            if route.matches(request.method, request.path):
-                try:
-                    return await route.handle(request)
-                except Exception as e:
-                    return await self._handle_exception(e)
-        
         # No matching route found
         return await self._handle_exception(
             ResourceNotFoundError(f"No route found for {request.method} {request.path}")
         )
     
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        """
+        ASGI 3 entry point, allowing the API to be served or mounted directly.
+        
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive callable.
+            send: The ASGI send callable.
+        """
+        if scope["type"] == "lifespan":
+            await self._handle_lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            raise ServerError(f"Unsupported ASGI scope type: {scope['type']}")
+        
+        # Read the full request body, usually delivered in a single message
+        message = await receive()
+        body = message.get("body", b"")
+        if message.get("more_body", False):
+            chunks = [body]
+            while message.get("more_body", False):
+                message = await receive()
+                chunks.append(message.get("body", b""))
+            body = b"".join(chunks)
+        
+        # Strip the mount prefix, if any
+        path = scope["path"]
+        root_path = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):] or "/"
+        
+        request = Request(
+            method=scope["method"],
+            path=path,
+            headers=_RawHeaders(scope["headers"]),
+            query_params=_RawQueryParams(scope["query_string"]),
+            body=body or None,
+        )
+        
+        response = await self.handle_request(request)
+        
+        # Serialize the response
+        response_body = _encode_body(response.body)
+        headers = _encode_headers(response.headers)
+        
+        # Compress larger bodies if the client supports it
+        if (
+            response.compress
+            and len(response_body) >= _COMPRESS_MIN_SIZE
+            and not _has_header(response.headers, "content-encoding")
+        ):
+            encoding = _negotiate_encoding(request.headers.get("accept-encoding", ""))
+            if encoding:
+                response_body = _COMPRESSORS[encoding](response_body)
+                headers.append((b"content-encoding", encoding.encode("latin-1")))
+            headers.append((b"vary", b"Accept-Encoding"))
+        # 1xx, 204 and 304 responses have no body and must not claim one
+        # (RFC 9110 8.6)
+        if response.status_code >= 200 and response.status_code not in (204, 304):
+            headers.append((b"content-length", str(len(response_body)).encode("latin-1")))
+        
+        await send({
+            "type": "http.response.start",
+            "status": response.status_code,
+            "headers": headers,
+        })
+        await send({"type": "http.response.body", "body": response_body})
+    
+    async def _handle_lifespan(self, receive: Callable, send: Callable) -> None:
+        """
+        Acknowledge ASGI lifespan startup and shutdown events.
+        
+        Args:
+            receive: The ASGI receive callable.
+            send: The ASGI send callable.
+        """
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+    
     async def _handle_exception(self, exception: Exception) -> Response:
         """
         Handle an exception.
@@ -461,10 +886,12 @@ class API:
         
         # Find the most specific handler for this exception type
         handler = None
+        handler_type = None
         for exc_type, h in self.error_handlers.items():
             if isinstance(exception, exc_type):
-                if handler is None or issubclass(exc_type, handler.__self__):
+                if handler_type is None or issubclass(exc_type, handler_type):
                     handler = h
+                    handler_type = exc_type
         
         # Fall back to the default handler
         if handler is None:
@@ -545,6 +972,102 @@ class API:
         )
 
 
+def _encode_body(body: Any) -> bytes:
+    """
+    Encode a response body for the wire.
+    
+    Args:
+        body: The response body.
+        
+    Returns:
+        The encoded body; anything other than bytes or str is sent as JSON.
+    """
+    if body is None:
+        return b""
+    if isinstance(body, bytes):
+        return body
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    return orjson.dumps(body)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against a response's ETag.
+    
+    Args:
+        if_none_match: The request's If-None-Match header, if any.
+        etag: The quoted ETag of the current response.
+        
+    Returns:
+        True if the header is "*" or lists the ETag, using the weak
+        comparison (a "W/" prefix is ignored).
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def _has_header(headers: Mapping[str, str], name: str) -> bool:
+    """
+    Check whether a header is set, ignoring case.
+    
+    Args:
+        headers: The response headers.
+        name: The lowercased header name.
+        
+    Returns:
+        True if the header is present.
+    """
+    return any(key.lower() == name for key in headers)
+
+
+@lru_cache(maxsize=128)
+def _negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Choose the best supported content encoding for an Accept-Encoding header.
+    
+    Args:
+        accept_encoding: The request's Accept-Encoding header.
+        
+    Returns:
+        The preferred encoding with the highest non-zero q-value, or None if
+        the body should be sent uncompressed.
+    """
+    qvalues: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding] = q
+    
+    # Codings not listed fall back to the "*" q-value, if any
+    default = qvalues.get("*", 0.0)
+    best, best_q = None, 0.0
+    for coding in _COMPRESSORS:
+        q = qvalues.get(coding, default)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
 def create_api(name: str = "API", version: str = "1.0.0") -> API:
     """
     Create a new API instance.
@@ -561,48 +1084,49 @@ def create_api(name: str = "API", version: str = "1.0.0") -> API:
 
 # Request validation and middleware utilities
 
-def validate_json_schema(schema: Dict[str, Any]) -> Callable:
+class JsonSchemaValidator:
     """
-    Create middleware to validate request JSON against a schema.
+    Middleware to validate request JSON against a schema.
     
-    Args:
-        schema: The JSON schema to validate against.
-        
-    Returns:
-        Middleware function.
+    The schema is compiled to a validator function once, when the
+    middleware is created.
     """
-    try:
-        # Try to import SchemaValidator from schema module
-        from llamaapi.schema import SchemaValidator
-        validator = SchemaValidator(schema)
-        
-        async def middleware(request: Request) -> Request:
-            data = request.json()
-            if data is not None:
-                validator.validate(data)
-            return request
-            
-        return middleware
-    except ImportError:
-        # Fall back to using jsonschema directly
-        try:
-            import jsonschema
-        except ImportError:
-            raise ImportError(
-                "The jsonschema package is required for schema validation. "
-                "Install it with: pip install jsonschema"
-            )
+    __slots__ = ("_validate",)
+    
+    def __init__(self, schema: Dict[str, Any]):
+        """
+        Initialize the validator.
         
-        async def middleware(request: Request) -> Request:
-            data = request.json()
-            if data is not None:
-                try:
-                    jsonschema.validate(data, schema)
-                except jsonschema.exceptions.ValidationError as e:
-                    raise ValidationError(f"JSON validation failed: {str(e)}", errors={"schema": str(e)})
-            return request
+        Args:
+            schema: The JSON schema to validate against.
+        """
+        self._validate = fastjsonschema.compile(schema)
+    
+    async def __call__(self, request: Request) -> Request:
+        """
+        Validate the request body.
         
-        return middleware
+        Args:
+            request: The request to validate.
+            
+        Returns:
+            The request.
+            
+        Raises:
+            ValidationError: If the body does not match the schema.
+        """
+        data = request.json()
+        if data is not None:
+            try:
+                self._validate(data)
+            except fastjsonschema.JsonSchemaValueException as e:
+                field = str(e.path[-1]) if len(e.path) > 1 else "schema"
+                raise ValidationError(f"JSON validation failed: {e.message}", errors={field: e.message})
+        return request
+
+
+# Create middleware to validate request JSON against a schema
+validate_json_schema = JsonSchemaValidator
 
 
 def require_auth(func: Callable) -> Callable:
@@ -638,7 +1162,8 @@ def log_request(request: Request) -> Request:
     Returns:
         The request.
     """
-    logger.info(f"{request.method} {request.path}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("%s %s", request.method, request.path)
     return request
 
 
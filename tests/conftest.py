@@ -0,0 +1,37 @@
+"""
+Shared test helpers.
+"""
+import importlib
+import os
+import sys
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+def _package_modules():
+    return [name for name in sys.modules if name.split('.')[0] == 'llamaapi']
+
+
+def import_from_src(*names):
+    """
+    Import modules of the llamaapi package under src/.
+    
+    The stray top-level llamaapi/ directory shadows src/llamaapi when the
+    suite runs from the repository root, and tests/test_client.py relies on
+    it, so whatever was loaded before is restored afterwards.
+    
+    Args:
+        names: Dotted module names, e.g. "llamaapi.server".
+        
+    Returns:
+        The imported modules, in the order given.
+    """
+    saved = {name: sys.modules.pop(name) for name in _package_modules()}
+    sys.path.insert(0, SRC_DIR)
+    try:
+        return tuple(importlib.import_module(name) for name in names)
+    finally:
+        sys.path.remove(SRC_DIR)
+        for name in _package_modules():
+            del sys.modules[name]
+        sys.modules.update(saved)
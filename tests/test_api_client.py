@@ -0,0 +1,132 @@
+"""
+Tests for the ApiClient request pipeline.
+"""
+import threading
+import time
+
+import httpx
+
+from conftest import import_from_src
+
+client_module, middleware_module = import_from_src("llamaapi.client", "llamaapi.middleware")
+ApiClient = client_module.ApiClient
+Middleware = middleware_module.Middleware
+
+
+class ArrivalMiddleware(Middleware):
+    """Counts requests as they enter the client."""
+    def __init__(self):
+        self.count = 0
+        self.lock = threading.Lock()
+    
+    def before_request(self, request):
+        with self.lock:
+            self.count += 1
+        return request
+
+
+def wait_for(condition, timeout=5.0):
+    """Poll until a condition holds or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_concurrent_identical_gets_are_coalesced():
+    """Test that concurrent identical GETs make a single upstream call."""
+    upstream_calls = []
+    entered = threading.Event()
+    release = threading.Event()
+    
+    def handler(request):
+        upstream_calls.append(request.url.path)
+        entered.set()
+        release.wait(5)
+        return httpx.Response(200, json={"path": request.url.path})
+    
+    arrivals = ArrivalMiddleware()
+    client = ApiClient(
+        "http://api.test",
+        middleware=[arrivals],
+        transport=httpx.MockTransport(handler),
+    )
+    results = []
+    
+    def fetch():
+        results.append(client.get("/items").json())
+    
+    leader = threading.Thread(target=fetch)
+    leader.start()
+    assert entered.wait(5)
+    
+    followers = [threading.Thread(target=fetch) for _ in range(4)]
+    for thread in followers:
+        thread.start()
+    wait_for(lambda: arrivals.count == 5)
+    time.sleep(0.05)
+    release.set()
+    
+    for thread in [leader, *followers]:
+        thread.join(5)
+    
+    assert upstream_calls == ["/items"]
+    assert results == [{"path": "/items"}] * 5
+    
+    # Once the request has completed, a new one goes upstream again
+    client.get("/items")
+    assert len(upstream_calls) == 2
+
+
+def test_streamed_requests_are_not_coalesced():
+    """Test that streamed GETs each get their own response."""
+    upstream_calls = []
+    entered = threading.Event()
+    release = threading.Event()
+    
+    def handler(request):
+        upstream_calls.append(request.url.path)
+        entered.set()
+        release.wait(5)
+        return httpx.Response(200, content=b"chunk")
+    
+    client = ApiClient("http://api.test", transport=httpx.MockTransport(handler))
+    responses = []
+    
+    def fetch():
+        responses.append(client.get("/export", stream=True))
+    
+    threads = [threading.Thread(target=fetch) for _ in range(2)]
+    threads[0].start()
+    assert entered.wait(5)
+    threads[1].start()
+    wait_for(lambda: len(upstream_calls) == 2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    
+    assert responses[0] is not responses[1]
+    assert [b"".join(r.iter_content()) for r in responses] == [b"chunk", b"chunk"]
+
+
+def test_idempotent_requests_are_retried_on_server_errors():
+    """Test that GETs are retried on 503 and POSTs are not."""
+    statuses = []
+    
+    def handler(request):
+        status = 503 if len(statuses) < 2 else 200
+        statuses.append(status)
+        return httpx.Response(status, headers={"Retry-After": "0"}, json={})
+    
+    client = ApiClient("http://api.test", retries=3, transport=httpx.MockTransport(handler))
+    assert client.get("/items", use_cache=False).status_code == 200
+    assert statuses == [503, 503, 200]
+    
+    statuses.clear()
+    client.retries = 1
+    assert client.get("/items", use_cache=False).status_code == 503
+    assert statuses == [503, 503]
+    
+    statuses.clear()
+    assert client.post("/items").status_code == 503
+    assert statuses == [503]
@@ -0,0 +1,55 @@
+"""
+Tests for the client-side cache implementations.
+"""
+from conftest import import_from_src
+
+cache_module = import_from_src("llamaapi.cache")[0]
+MemoryCache = cache_module.MemoryCache
+
+
+def test_memory_cache_evicts_least_recently_used():
+    """Test that reads keep entries alive when the cache is full."""
+    cache = MemoryCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_memory_cache_expires_entries(monkeypatch):
+    """Test that entries past their TTL are dropped on read."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    
+    cache = MemoryCache()
+    cache.set("short", "x", ttl=10)
+    cache.set("forever", "y")
+    
+    now[0] += 5
+    assert cache.get("short") == "x"
+    
+    now[0] += 10
+    assert cache.get("short") is None
+    assert "short" not in cache.cache
+    assert cache.get("forever") == "y"
+
+
+def test_memory_cache_delete_and_clear():
+    """Test removing single entries and clearing the cache."""
+    cache = MemoryCache()
+    cache.set("a", 1)
+    cache.set("b", 2)
+    
+    cache.delete("a")
+    cache.delete("missing")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    
+    cache.clear()
+    assert cache.get("b") is None
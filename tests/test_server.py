@@ -0,0 +1,306 @@
+"""
+Tests for the ASGI API server.
+"""
+import asyncio
+
+import httpx
+
+from conftest import import_from_src
+
+server_module = import_from_src("llamaapi.server")[0]
+API = server_module.API
+HttpMethod = server_module.HttpMethod
+Request = server_module.Request
+Response = server_module.Response
+
+
+def request(api, method, path, **kwargs):
+    """Send a single request to the API through httpx's ASGI transport."""
+    async def send():
+        transport = httpx.ASGITransport(app=api)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.request(method, path, **kwargs)
+    return asyncio.run(send())
+
+
+def test_dispatch_prefers_earlier_routes():
+    """Test that the first registered matching route handles a request."""
+    api = API()
+    
+    @api.route("/users/me")
+    def me(request):
+        return Response().with_json({"route": "me"})
+    
+    @api.route("/users/{user_id}")
+    def user(request):
+        return Response().with_json({"route": "user", "id": request.path_params["user_id"]})
+    
+    assert request(api, "GET", "/users/me").json() == {"route": "me"}
+    assert request(api, "GET", "/users/42").json() == {"route": "user", "id": "42"}
+
+
+def test_dispatch_path_params_and_methods():
+    """Test path parameter extraction and per-method dispatch."""
+    api = API()
+    
+    @api.route("/orgs/{org}/repos/{repo}", methods=[HttpMethod.GET, HttpMethod.DELETE])
+    def repo(request):
+        return Response().with_json({"method": request.method, **request.path_params})
+    
+    response = request(api, "DELETE", "/orgs/llama/repos/api.v1")
+    assert response.json() == {"method": "DELETE", "org": "llama", "repo": "api.v1"}
+    
+    assert request(api, "POST", "/orgs/llama/repos/api").status_code == 404
+    assert request(api, "GET", "/orgs/llama/repos/api/extra").status_code == 404
+
+
+def test_dispatch_sees_routes_added_later():
+    """Test that routes added after the first request are dispatched."""
+    api = API()
+    
+    @api.route("/a")
+    def a(request):
+        return Response().with_json("a")
+    
+    assert request(api, "GET", "/b").status_code == 404
+    
+    @api.route("/b")
+    def b(request):
+        return Response().with_json("b")
+    
+    assert request(api, "GET", "/b").json() == "b"
+
+
+def test_cache_response_etag_and_invalidation():
+    """Test 304 responses on a matching ETag and invalidation on writes."""
+    api = API()
+    items = {"1": {"id": "1", "name": "one"}}
+    calls = []
+    
+    @api.route("/items/{item_id}")
+    @api.cache_response
+    def get_item(request):
+        calls.append(request.path)
+        return Response().with_json(items[request.path_params["item_id"]])
+    
+    first = request(api, "GET", "/items/1")
+    etag = first.headers["etag"]
+    assert first.json() == {"id": "1", "name": "one"}
+    
+    not_modified = request(api, "GET", "/items/1", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert "content-length" not in not_modified.headers
+    
+    # Lists, weak validators and "*" match too
+    for header in (f'"other", {etag}', f"W/{etag}", "*"):
+        assert request(api, "GET", "/items/1", headers={"If-None-Match": header}).status_code == 304
+    assert len(calls) == 1
+    
+    items["1"]["name"] = "uno"
+    api.invalidate_cache("/items")
+    
+    changed = request(api, "GET", "/items/1", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["name"] == "uno"
+    assert changed.headers["etag"] != etag
+    assert len(calls) == 2
+
+
+def test_cache_response_skips_errors():
+    """Test that only successful responses are cached."""
+    api = API()
+    calls = []
+    
+    @api.route("/flaky")
+    @api.cache_response
+    def flaky(request):
+        calls.append(1)
+        if len(calls) == 1:
+            return Response(status_code=503).with_json({"error": "busy"})
+        return Response().with_json("ok")
+    
+    assert request(api, "GET", "/flaky").status_code == 503
+    assert request(api, "GET", "/flaky").json() == "ok"
+    assert request(api, "GET", "/flaky").json() == "ok"
+    assert len(calls) == 2
+
+
+def test_compression_respects_q_values():
+    """Test Accept-Encoding negotiation, including q=0 exclusions."""
+    api = API()
+    payload = {"data": "x" * 4096}
+    
+    @api.route("/big")
+    def big(request):
+        return Response().with_json(payload)
+    
+    cases = {
+        "gzip, zstd": "zstd",
+        "zstd;q=0, gzip": "gzip",
+        "gzip;q=1.0, zstd;q=0.5": "gzip",
+        "*;q=0.1, zstd;q=0": "gzip",
+        "zstd;q=0, gzip;q=0": None,
+        "identity": None,
+    }
+    for accept_encoding, expected in cases.items():
+        response = request(api, "GET", "/big", headers={"Accept-Encoding": accept_encoding})
+        assert response.headers.get("content-encoding") == expected, accept_encoding
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.json() == payload
+
+
+def test_compression_skips_small_and_encoded_bodies():
+    """Test that small or already encoded bodies are sent as they are."""
+    api = API()
+    
+    @api.route("/small")
+    def small(request):
+        return Response().with_json({"ok": True})
+    
+    @api.route("/encoded")
+    def encoded(request):
+        return Response(body=b"\x00" * 4096, headers={"Content-Encoding": "br"})
+    
+    small_response = request(api, "GET", "/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small_response.headers
+    
+    encoded_response = request(api, "GET", "/encoded", headers={"Accept-Encoding": "gzip"})
+    assert encoded_response.headers["content-encoding"] == "br"
+    assert encoded_response.headers["content-length"] == "4096"
+
+
+def test_cache_response_etag_per_encoding():
+    """Test that each compressed variant is cached under its own ETag."""
+    api = API()
+    calls = []
+    
+    @api.route("/report")
+    @api.cache_response
+    def report(request):
+        calls.append(1)
+        return Response().with_json({"rows": list(range(1000))})
+    
+    gzipped = request(api, "GET", "/report", headers={"Accept-Encoding": "gzip"})
+    plain = request(api, "GET", "/report", headers={"Accept-Encoding": "identity"})
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.headers["etag"].endswith('-gzip"')
+    assert "content-encoding" not in plain.headers
+    assert gzipped.json() == plain.json()
+    
+    # An ETag only revalidates the representation it was issued for
+    revalidated = request(
+        api, "GET", "/report",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": gzipped.headers["etag"]},
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == gzipped.headers["etag"]
+    mismatched = request(
+        api, "GET", "/report",
+        headers={"Accept-Encoding": "identity", "If-None-Match": gzipped.headers["etag"]},
+    )
+    assert mismatched.status_code == 200
+    assert len(calls) == 1
+
+
+def test_cache_response_ignores_results_computed_across_invalidation():
+    """Test that a write landing while the handler awaits is not masked."""
+    api = API()
+    store = {"value": 1}
+    
+    @api.route("/item")
+    @api.cache_response
+    async def get_item(request):
+        value = store["value"]
+        await asyncio.sleep(0.01)
+        return Response(body=str(value).encode())
+    
+    async def read():
+        return await api.handle_request(Request(method="GET", path="/item", headers={}))
+    
+    async def write():
+        await asyncio.sleep(0)
+        store["value"] = 2
+        api.invalidate_cache("/item")
+    
+    async def scenario():
+        stale, _ = await asyncio.gather(read(), write())
+        fresh = await read()
+        return stale.body, fresh.body
+    
+    assert asyncio.run(scenario()) == (b"1", b"2")
+
+
+def test_bodyless_statuses_omit_content_length():
+    """Test that 204 responses carry no Content-Length header."""
+    api = API()
+    
+    @api.route("/noop", methods=HttpMethod.DELETE)
+    def noop(request):
+        return Response(status_code=204)
+    
+    response = request(api, "DELETE", "/noop")
+    assert response.status_code == 204
+    assert "content-length" not in response.headers
+
+
+class Tag:
+    """Middleware object with an async __call__ that records its name."""
+    def __init__(self, name):
+        self.name = name
+    
+    async def __call__(self, request):
+        request.context.setdefault("trail", []).append(self.name)
+        return request
+
+
+def tag(name):
+    """Plain sync middleware that records its name."""
+    def middleware(request):
+        request.context.setdefault("trail", []).append(name)
+        return request
+    return middleware
+
+
+def deferred(name):
+    """Sync middleware that returns an awaitable instead of a request."""
+    async def finish(request):
+        request.context.setdefault("trail", []).append(name)
+        return request
+    return lambda request: finish(request)
+
+
+def test_middleware_chain_mixes_sync_and_async():
+    """Test the compiled chain with every supported middleware shape."""
+    api = API()
+    api.add_middleware(tag("sync"))
+    api.add_middleware(Tag("object"))
+    api.add_middleware(deferred("deferred"))
+    
+    @api.route("/trail", middleware=[Tag("route-object"), tag("route-sync")])
+    def trail(request):
+        return Response().with_json(request.context["trail"])
+    
+    assert request(api, "GET", "/trail").json() == [
+        "sync", "object", "deferred", "route-object", "route-sync",
+    ]
+
+
+def test_middleware_chain_recompiles_after_direct_edits():
+    """Test that editing the middleware lists in place takes effect."""
+    api = API()
+    api.add_middleware(tag("first"))
+    
+    @api.route("/trail")
+    def trail(request):
+        return Response().with_json(request.context.get("trail", []))
+    
+    assert request(api, "GET", "/trail").json() == ["first"]
+    
+    api.middleware.append(Tag("appended"))
+    api.routes[0].middleware.append(tag("route"))
+    assert request(api, "GET", "/trail").json() == ["first", "appended", "route"]
+    
+    api.middleware[0] = tag("replaced")
+    api.routes[0].middleware.clear()
+    assert request(api, "GET", "/trail").json() == ["replaced", "appended"]